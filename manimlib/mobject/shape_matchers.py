@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from manimlib.constants import *
 from manimlib.mobject.geometry import Line
 from manimlib.mobject.geometry import Rectangle
@@ -18,8 +20,10 @@ class SurroundingRectangle(Rectangle):
 
     def __init__(self, mobject, **kwargs):
         digest_config(self, kwargs)
-        kwargs["width"] = mobject.get_width() + 2 * (self.width_buff or self.buff)
-        kwargs["height"] = mobject.get_height() + 2 * (self.height_buff or self.buff)
+        width_buff = self.buff if self.width_buff is None else self.width_buff
+        height_buff = self.buff if self.height_buff is None else self.height_buff
+        kwargs["width"] = mobject.get_width() + 2 * width_buff
+        kwargs["height"] = mobject.get_height() + 2 * height_buff
         Rectangle.__init__(self, **kwargs)
         self.move_to(mobject)
 
@@ -59,6 +63,20 @@ class BackgroundRectangle(SurroundingRectangle):
         return Color(self.color)
 
 
+@lru_cache(maxsize=1)
+def get_cross_lines():
+    """
+    The two lines of a Cross, subdivided but not yet fit to any
+    mobject.  Each Cross copies these rather than rebuilding them.
+    """
+    lines = VGroup(
+        Line(UL, DR),
+        Line(UR, DL),
+    )
+    lines.insert_n_curves(2)
+    return lines
+
+
 class Cross(VGroup):
     CONFIG = {
         "stroke_color": RED,
@@ -66,11 +84,7 @@ class Cross(VGroup):
     }
 
     def __init__(self, mobject, **kwargs):
-        super().__init__(
-            Line(UL, DR),
-            Line(UR, DL),
-        )
-        self.insert_n_curves(2)
+        super().__init__(*(line.copy() for line in get_cross_lines()))
         self.replace(mobject, stretch=True)
         self.set_stroke(self.stroke_color, width=self.stroke_width)
 
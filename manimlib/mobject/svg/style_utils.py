@@ -3,7 +3,7 @@
 
 __all__ = ["cascade_element_style", "parse_style", "parse_color_string"]
 
-from xml.dom.minidom import Element as MinidomElement
+from xml.etree.ElementTree import Element
 from colour import web2hex
 from ...utils.color import rgb_to_hex
 
@@ -30,7 +30,7 @@ SVG_DEFAULT_ATTRIBUTES: Dict[str, str] = {
 
 
 def cascade_element_style(
-    element: MinidomElement, inherited: Dict[str, str]
+    element: Element, inherited: Dict[str, str]
 ) -> Dict[str, str]:
     """Collect the element's style attributes based upon both its inheritance and its own attributes.
 
@@ -43,7 +43,7 @@ def cascade_element_style(
 
     Parameters
     ----------
-    element : :class:`MinidomElement`
+    element : :class:`Element`
         Element of the SVG parse tree
 
     inherited : :class:`dict`
@@ -59,14 +59,14 @@ def cascade_element_style(
 
     # cascade the regular elements.
     for attr in CASCADING_STYLING_ATTRIBUTES:
-        entry = element.getAttribute(attr)
+        entry = element.get(attr)
         if entry:
             style[attr] = entry
 
     # the style attribute should be handled separately in order to
     # break it up nicely. furthermore, style takes priority over other
     # attributes in the same element.
-    style_specs = element.getAttribute("style")
+    style_specs = element.get("style")
     if style_specs:
         for style_spec in style_specs.split(";"):
             try:
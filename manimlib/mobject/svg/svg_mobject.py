@@ -1,13 +1,19 @@
 import itertools as it
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import re
 import string
 from typing import Dict, List
 import warnings
 import os
 import hashlib
+import tempfile
+import zipfile
 
+from xml.dom import XMLNS_NAMESPACE
 from xml.dom import minidom
-from xml.dom.minidom import Element as MinidomElement
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
 
 from manimlib.constants import DEFAULT_STROKE_WIDTH
 from manimlib.constants import ORIGIN, UP, DOWN, LEFT, RIGHT
@@ -22,14 +28,248 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import *
 from manimlib.utils.config_ops import digest_config
+from manimlib.utils.config_ops import merge_dicts_recursively
 from manimlib.utils.directories import get_mobject_data_dir, get_vector_image_dir
 from manimlib.utils.images import get_full_vector_image_path
 
 
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+TRANSFORM_NAMES = ["matrix", "translate", "scale", "rotate", "skewX", "skewY"]
+
+# Borrowed/Inspired from:
+# https://github.com/cjlano/svg/blob/3ea3384457c9780fa7d67837c9c5fd4ebc42cb3b/svg/svg.py#L75
+
+# match any SVG transformation with its parameter (until final parenthese)
+# [^)]*    == anything but a closing parenthese
+# '|'.join == OR-list of SVG transformations
+TRANSFORM_RE = re.compile("|".join([x + r"[^)]*\)" for x in TRANSFORM_NAMES]))
+
+NUMBER_CHARACTERS = frozenset(string.digits + ".-")
+
+NUMBER_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Associates svg path commands to the VMobject method implementing them,
+# and the number of points each call takes in
+PATH_COMMAND_TO_METHOD = {
+    "M": ("start_new_path", 1),
+    "L": ("add_line_to", 1),
+    "H": ("add_line_to", 1),
+    "V": ("add_line_to", 1),
+    "C": ("add_cubic_bezier_curve_to", 3),
+    "S": ("add_smooth_cubic_curve_to", 2),
+    "Q": ("add_quadratic_bezier_curve_to", 2),
+    "T": ("add_smooth_curve_to", 1),
+    "A": ("add_quadratic_bezier_curve_to", 2),  # TODO
+    "Z": ("close_path", 0),
+}
+
+# Methods which take all of a command's points at once, when one exists
+PATH_COMMAND_TO_BULK_METHOD = {
+    "L": "add_lines_to",
+    "H": "add_lines_to",
+    "V": "add_lines_to",
+    "C": "add_cubic_bezier_curves_to",
+    "Q": "add_quadratic_bezier_curves_to",
+}
+
+# Config of VMobjectFromSVGPathstring which changes the resulting points
+PATH_CONFIG_KEYS = (
+    "long_lines",
+    "should_subdivide_sharp_curves",
+    "should_remove_null_curves",
+)
+
+# Files with fewer paths than this aren't worth a thread pool
+MIN_PATHS_TO_PREFETCH = 16
+
+# Raised by load_path_arrays for a missing, truncated or otherwise
+# unreadable cache file, all of which just mean the path is retraced
+UNREADABLE_PATH_DATA_ERRORS = (zipfile.BadZipFile, ValueError, KeyError, OSError)
+
+PATH_COMMAND_RE = re.compile("[{0}{1}]".format(
+    "".join(PATH_COMMAND_TO_METHOD),
+    "".join(PATH_COMMAND_TO_METHOD).lower(),
+))
+
+
+def get_tag_name(element):
+    """Returns the tag of ``element`` with any ``{namespace}`` prefix removed."""
+    tag = element.tag
+    if tag[0] == "{":
+        return tag[tag.index("}") + 1:]
+    return tag
+
+
+def minidom_to_element(node):
+    """Converts a minidom element, and everything under it, to the
+    equivalent ElementTree element, for callers written against the
+    minidom based parser SVGMobject used to have.
+    """
+    def get_name(name_node):
+        if name_node.namespaceURI:
+            return f"{{{name_node.namespaceURI}}}{name_node.localName}"
+        return name_node.nodeName
+
+    element = Element(get_name(node))
+    for attr in node.attributes.values():
+        # ElementTree keeps namespace declarations out of the attributes
+        if attr.namespaceURI != XMLNS_NAMESPACE:
+            element.set(get_name(attr), attr.value)
+    for child in node.childNodes:
+        if child.nodeType == child.ELEMENT_NODE:
+            element.append(minidom_to_element(child))
+    return element
+
+
+def as_element(element):
+    """Returns ``element``, converted to ElementTree first if it is a
+    minidom element, so that helpers accept either kind.
+    """
+    if isinstance(element, minidom.Node):
+        return minidom_to_element(element)
+    return element
+
+
+def get_xlink_href(element):
+    """Returns the ``xlink:href`` (or SVG 2 ``href``) attribute of ``element``."""
+    return element.get(XLINK_HREF) or element.get("href", "")
+
+
+@lru_cache(maxsize=256)
+def resolve_svg_file(file_name, cwd):
+    """Checks that file_name can be found and returns the path to load it
+    from.  Each lookup costs several stat calls, and the same files get
+    loaded over and over, so results are cached.  Relative names depend
+    on the working directory, which is why cwd is part of the key.
+    """
+    possible_paths = [
+        file_name,
+        os.path.join(cwd, file_name),
+        os.path.join(get_vector_image_dir(), file_name),
+        os.path.join(get_vector_image_dir(), file_name + ".xdv"),
+        os.path.join(get_vector_image_dir(), file_name + ".svg"),
+        file_name + ".svg",
+        file_name + ".xdv",
+    ]
+    if not any(os.path.exists(path) for path in possible_paths):
+        error = f"From: {cwd}, could not find {file_name} at either of these locations: {possible_paths}"
+        raise IOError(error)
+    return get_full_vector_image_path(file_name)
+
+
+@lru_cache(maxsize=256)
+def parse_svg_file(file_path, mtime):
+    """Returns the root element of the SVG at ``file_path``.
+
+    The modification time is part of the cache key so that edited files
+    get reparsed.  The returned tree is shared, so it must not be mutated.
+    """
+    return ElementTree.parse(file_path).getroot()
+
+
+@lru_cache(maxsize=2048)
+def load_path_arrays(file_path):
+    """Loads the points, triangulation and bounding box saved for a path.
+
+    The arrays are shared between all callers, so they must not be mutated.
+    """
+    with np.load(file_path) as data:
+        return data["points"], data["triangulation"], data["bounding_box"]
+
+
+def save_path_arrays(file_path, points, triangulation, bounding_box):
+    """Saves the arrays for a path, as read back by :func:`load_path_arrays`.
+
+    The data is written to a temporary file which is then moved into place,
+    so an interrupted or concurrent write never leaves a partial file behind.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        suffix=".npz", dir=os.path.dirname(file_path)
+    )
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            np.savez(
+                temp_file,
+                points=points,
+                triangulation=triangulation,
+                bounding_box=bounding_box,
+            )
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def get_path_data_filepath(path_string, path_config):
+    # The config changes the resulting points, so it is part of the key.
+    # This only names a cache file, so a fast 64-bit digest is plenty.
+    hasher = hashlib.blake2b(
+        (path_string + str(path_config)).encode(), digest_size=8
+    )
+    path_hash = hasher.hexdigest()
+    return os.path.join(get_mobject_data_dir(), f"{path_hash}.npz")
+
+
+# Files which prefetch_path_arrays has already read into the cache of
+# load_path_arrays, so that they aren't prefetched again
+prefetched_path_files = set()
+
+
+def get_unprefetched_path_files(file_paths):
+    """Returns those of ``file_paths`` which haven't been prefetched yet."""
+    if len(prefetched_path_files) > load_path_arrays.cache_info().maxsize:
+        # Older entries may have been evicted from the cache by now
+        prefetched_path_files.clear()
+    return [path for path in file_paths if path not in prefetched_path_files]
+
+
+def prefetch_path_arrays(file_paths):
+    """Reads the saved data at each of ``file_paths`` into the cache of
+    :func:`load_path_arrays` on a thread pool, skipping files which are
+    missing or unreadable, as those paths get retraced anyway.
+    """
+    def try_load(file_path):
+        try:
+            load_path_arrays(file_path)
+            return True
+        except UNREADABLE_PATH_DATA_ERRORS:
+            return False
+
+    with ThreadPoolExecutor() as executor:
+        loaded = list(executor.map(try_load, file_paths))
+    prefetched_path_files.update(
+        path for path, success in zip(file_paths, loaded) if success
+    )
+
+
+def normalize_number_separators(num_string):
+    # Normalize all separators to whitespace so that the C-level
+    # str.split can do the tokenizing in a single pass
+    num_string = num_string.replace(",", " ").replace("-", " -")
+    return num_string.replace("e -", "e-")
+
+
 def string_to_numbers(num_string):
-    num_string = num_string.replace("-", ",-")
-    num_string = num_string.replace("e,-", "e-")
-    return [float(s) for s in re.split("[ ,]", num_string) if s != ""]
+    return [float(s) for s in normalize_number_separators(num_string).split()]
+
+
+def scan_path_string(path_string, command_re=PATH_COMMAND_RE):
+    """Tokenizes a whole SVG path ``d`` attribute in one pass.
+
+    Returns the list of commands, the offsets at which each command's
+    numbers start (plus a final end offset), and one flat array holding
+    all of the path's numbers.
+    """
+    path_string = normalize_number_separators(path_string)
+    commands = command_re.findall(path_string)
+    tokens = [seg.split() for seg in command_re.split(path_string)[1:]]
+    offsets = [0, *it.accumulate(len(seg_tokens) for seg_tokens in tokens)]
+    numbers = np.fromiter(
+        map(float, it.chain.from_iterable(tokens)),
+        dtype=float, count=offsets[-1],
+    )
+    return commands, offsets, numbers
 
 
 class SVGMobject(VMobject):
@@ -53,7 +293,6 @@ class SVGMobject(VMobject):
         self.ensure_valid_file()
         if file_name is None:
             raise Exception("Must specify file for SVGMobject")
-        self.file_path = get_full_vector_image_path(file_name)
 
         super().__init__(**kwargs)
         self.move_into_position()
@@ -65,29 +304,7 @@ class SVGMobject(VMobject):
         if self.file_name is None:
             raise Exception("Must specify file for SVGMobject")
 
-        if os.path.exists(self.file_name):
-            self.file_path = self.file_name
-            return
-
-        relative = os.path.join(os.getcwd(), self.file_name)
-        if os.path.exists(relative):
-            self.file_path = relative
-            return
-
-        possible_paths = [
-            os.path.join(get_vector_image_dir(), self.file_name),
-            os.path.join(get_vector_image_dir(), self.file_name + ".xdv"),
-            os.path.join(get_vector_image_dir(), self.file_name + ".svg"),
-            self.file_name,
-            self.file_name + ".svg",
-            self.file_name + ".xdv",
-        ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                self.file_path = path
-                return
-        error = f"From: {os.getcwd()}, could not find {self.file_name} at either of these locations: {possible_paths}"
-        raise IOError(error)
+        self.file_path = resolve_svg_file(self.file_name, os.getcwd())
 
     def move_into_position(self):
         if self.should_center:
@@ -102,18 +319,45 @@ class SVGMobject(VMobject):
         the SVGMobject's points from XML tags, populating self.mobjects, and
         any submobjects within self.mobjects.
         """
-        doc = minidom.parse(self.file_path)
-        for svg in doc.getElementsByTagName("svg"):
+        root = parse_svg_file(self.file_path, os.path.getmtime(self.file_path))
+        self.prefetch_path_data(root)
+        for svg in root.iter():
+            if get_tag_name(svg) != "svg":
+                continue
             mobjects = self.get_mobjects_from(svg, {})
             if self.unpack_groups:
                 self.add(*mobjects)
             else:
                 self.add(*mobjects[0].submobjects)
-        doc.unlink()
+
+    def prefetch_path_data(self, root: Element):
+        """Loads previously saved data for all paths in the file in
+        parallel, so that building their submobjects only hits memory.
+        """
+        path_strings = set(
+            element.get("d")
+            for element in root.iter()
+            if get_tag_name(element) == "path" and element.get("d")
+        )
+        if len(path_strings) < MIN_PATHS_TO_PREFETCH:
+            return
+        config = merge_dicts_recursively(
+            VMobjectFromSVGPathstring.CONFIG, self.path_string_config
+        )
+        path_config = tuple(config[key] for key in PATH_CONFIG_KEYS)
+        # Reloading the same file mostly finds everything in memory
+        # already, in which case there's no need for a thread pool
+        file_paths = get_unprefetched_path_files([
+            get_path_data_filepath(path_string, path_config)
+            for path_string in path_strings
+        ])
+        if len(file_paths) < MIN_PATHS_TO_PREFETCH:
+            return
+        prefetch_path_arrays(file_paths)
 
     def get_mobjects_from(
         self,
-        element: MinidomElement,
+        element: Element,
         inherited_style: Dict[str, str],
         within_defs: bool = False,
     ) -> List[VMobject]:
@@ -138,38 +382,40 @@ class SVGMobject(VMobject):
             A VMobject representing the associated SVG element.
         """
         result = []
-        # First, let all non-elements pass (like text entries)
-        if not isinstance(element, MinidomElement):
+        if isinstance(element, minidom.Node):
+            # Subclasses may still pass in nodes from minidom
+            if element.nodeType != element.ELEMENT_NODE:
+                return result
+            element = as_element(element)
+        # First, let all non-elements pass (like comments)
+        if not isinstance(element.tag, str):
             return result
 
+        tag_name = get_tag_name(element)
         style = cascade_element_style(element, inherited_style)
-        is_defs = element.tagName == "defs"
+        is_defs = tag_name == "defs"
 
-        if element.tagName == "style":
+        if tag_name == "style":
             pass  # TODO, handle style
-        elif element.tagName in ["g", "svg", "symbol", "defs"]:
-            result += it.chain(
-                *[
-                    self.get_mobjects_from(
-                        child, style, within_defs=within_defs or is_defs
-                    )
-                    for child in element.childNodes
-                ]
-            )
-        elif element.tagName == "path":
-            temp = element.getAttribute("d")
+        elif tag_name in ["g", "svg", "symbol", "defs"]:
+            for child in element:
+                result.extend(self.get_mobjects_from(
+                    child, style, within_defs=within_defs or is_defs
+                ))
+        elif tag_name == "path":
+            temp = element.get("d", "")
             if temp != "":
                 result.append(self.path_string_to_mobject(temp, style))
-        elif element.tagName == "use":
+        elif tag_name == "use":
             # note, style is calcuated in a different way for `use` elements.
             result += self.use_to_mobjects(element, style)
-        elif element.tagName == "rect":
+        elif tag_name == "rect":
             result.append(self.rect_to_mobject(element, style))
-        elif element.tagName == "circle":
+        elif tag_name == "circle":
             result.append(self.circle_to_mobject(element, style))
-        elif element.tagName == "ellipse":
+        elif tag_name == "ellipse":
             result.append(self.ellipse_to_mobject(element, style))
-        elif element.tagName in ["polygon", "polyline"]:
+        elif tag_name in ["polygon", "polyline"]:
             result.append(self.polygon_to_mobject(element, style))
         else:
             pass  # TODO
@@ -179,10 +425,10 @@ class SVGMobject(VMobject):
         if len(result) > 1 and not self.unpack_groups:
             result = [VGroup(*result)]
 
-        if within_defs and element.hasAttribute("id"):
+        if within_defs and "id" in element.attrib:
             # it seems wasteful to throw away the actual element,
             # but I'd like the parsing to be as similar as possible
-            self.def_map[element.getAttribute("id")] = (style, element)
+            self.def_map[element.get("id")] = (style, element)
         if is_defs:
             # defs shouldn't be part of the result tree, only the id dictionary.
             return []
@@ -212,13 +458,13 @@ class SVGMobject(VMobject):
         )
 
     def use_to_mobjects(
-        self, use_element: MinidomElement, local_style: Dict
+        self, use_element: Element, local_style: Dict
     ) -> List[VMobject]:
         """Converts a SVG <use> element to a collection of VMobjects.
 
         Parameters
         ----------
-        use_element : :class:`MinidomElement`
+        use_element : :class:`Element`
             An SVG <use> element which represents nodes that should be
             duplicated elsewhere.
 
@@ -233,8 +479,9 @@ class SVGMobject(VMobject):
             A collection of VMobjects that are a copy of the defined object
         """
 
+        use_element = as_element(use_element)
         # Remove initial "#" character
-        ref = use_element.getAttribute("xlink:href")[1:]
+        ref = get_xlink_href(use_element)[1:]
 
         try:
             def_style, def_element = self.def_map[ref]
@@ -251,17 +498,22 @@ class SVGMobject(VMobject):
         return self.get_mobjects_from(def_element, style)
 
     def attribute_to_float(self, attr):
-        stripped_attr = "".join(
-            [char for char in attr if char in string.digits + "." + "-"]
-        )
-        return float(stripped_attr)
+        try:
+            # Most attributes are plain numbers
+            return float(attr)
+        except ValueError:
+            # Otherwise strip units and the like, e.g. "10px"
+            stripped_attr = "".join(
+                char for char in attr if char in NUMBER_CHARACTERS
+            )
+            return float(stripped_attr)
 
-    def polygon_to_mobject(self, polygon_element: MinidomElement, style: dict):
+    def polygon_to_mobject(self, polygon_element: Element, style: dict):
         """Constructs a VMobject from a SVG <polygon> element.
 
         Parameters
         ----------
-        polygon_element : :class:`minidom.Element`
+        polygon_element : :class:`Element`
             An SVG polygon element.
 
         style : :class:`dict`
@@ -272,21 +524,21 @@ class SVGMobject(VMobject):
         VMobjectFromSVGPathstring
             A VMobject representing the polygon.
         """
-        # This seems hacky... yes it is.
-        path_string = polygon_element.getAttribute("points").lstrip()
-        for digit in string.digits:
-            path_string = path_string.replace(" " + digit, " L" + digit)
-        path_string = "M" + path_string
-        if polygon_element.tagName == "polygon":
+        polygon_element = as_element(polygon_element)
+        numbers = string_to_numbers(polygon_element.get("points", ""))
+        path_string = "M" + " L".join(
+            f"{x} {y}" for x, y in zip(numbers[0::2], numbers[1::2])
+        )
+        if get_tag_name(polygon_element) == "polygon":
             path_string = path_string + "Z"
         return self.path_string_to_mobject(path_string, style)
 
-    def circle_to_mobject(self, circle_element: MinidomElement, style: dict):
+    def circle_to_mobject(self, circle_element: Element, style: dict):
         """Creates a Circle VMobject from a SVG <circle> command.
 
         Parameters
         ----------
-        circle_element : :class:`minidom.Element`
+        circle_element : :class:`Element`
             A SVG circle path command.
 
         style : :class:`dict`
@@ -297,21 +549,22 @@ class SVGMobject(VMobject):
         Circle
             A Circle VMobject
         """
+        circle_element = as_element(circle_element)
         x, y, r = [
-            self.attribute_to_float(circle_element.getAttribute(key))
-            if circle_element.hasAttribute(key)
+            self.attribute_to_float(circle_element.get(key))
+            if key in circle_element.attrib
             else 0.0
             for key in ("cx", "cy", "r")
         ]
         return Circle(radius=r, **parse_style(style)).shift(x * RIGHT + y * DOWN)
 
-    def ellipse_to_mobject(self, circle_element: MinidomElement, style: dict):
+    def ellipse_to_mobject(self, circle_element: Element, style: dict):
         """Creates a stretched Circle VMobject from a SVG <circle> path
         command.
 
         Parameters
         ----------
-        circle_element : :class:`minidom.Element`
+        circle_element : :class:`Element`
             A SVG circle path command.
 
         style : :class:`dict`
@@ -322,9 +575,10 @@ class SVGMobject(VMobject):
         Circle
             A Circle VMobject
         """
+        circle_element = as_element(circle_element)
         x, y, rx, ry = [
-            self.attribute_to_float(circle_element.getAttribute(key))
-            if circle_element.hasAttribute(key)
+            self.attribute_to_float(circle_element.get(key))
+            if key in circle_element.attrib
             else 0.0
             for key in ("cx", "cy", "rx", "ry")
         ]
@@ -334,12 +588,12 @@ class SVGMobject(VMobject):
         result.shift(x * RIGHT + y * DOWN)
         return result
 
-    def rect_to_mobject(self, rect_element: MinidomElement, style: dict):
+    def rect_to_mobject(self, rect_element: Element, style: dict):
         """Converts a SVG <rect> command to a VMobject.
 
         Parameters
         ----------
-        rect_element : minidom.Element
+        rect_element : Element
             A SVG rect path command.
 
         style : dict
@@ -351,8 +605,9 @@ class SVGMobject(VMobject):
             Creates either a Rectangle, or RoundRectangle, VMobject from a
             rect element.
         """
-        stroke_width = rect_element.getAttribute("stroke-width")
-        corner_radius = rect_element.getAttribute("rx")
+        rect_element = as_element(rect_element)
+        stroke_width = rect_element.get("stroke-width", "")
+        corner_radius = rect_element.get("rx", "")
 
         if stroke_width in ["", "none", "0"]:
             stroke_width = 0
@@ -367,14 +622,14 @@ class SVGMobject(VMobject):
 
         if corner_radius == 0:
             mob = Rectangle(
-                width=self.attribute_to_float(rect_element.getAttribute("width")),
-                height=self.attribute_to_float(rect_element.getAttribute("height")),
+                width=self.attribute_to_float(rect_element.get("width", "")),
+                height=self.attribute_to_float(rect_element.get("height", "")),
                 **parsed_style,
             )
         else:
             mob = RoundedRectangle(
-                width=self.attribute_to_float(rect_element.getAttribute("width")),
-                height=self.attribute_to_float(rect_element.getAttribute("height")),
+                width=self.attribute_to_float(rect_element.get("width", "")),
+                height=self.attribute_to_float(rect_element.get("height", "")),
                 corner_radius=corner_radius,
                 **parsed_style,
             )
@@ -388,67 +643,61 @@ class SVGMobject(VMobject):
 
         Parameters
         ----------
-        element : :class:`minidom.Element`
+        element : :class:`Element`
             The transform command to perform
 
         mobject : :class:`Mobject`
             The Mobject to transform.
         """
+        element = as_element(element)
 
-        if element.hasAttribute("x") and element.hasAttribute("y"):
-            x = self.attribute_to_float(element.getAttribute("x"))
+        if "x" in element.attrib and "y" in element.attrib:
+            x = self.attribute_to_float(element.get("x"))
             # Flip y
-            y = -self.attribute_to_float(element.getAttribute("y"))
+            y = -self.attribute_to_float(element.get("y"))
             mobject.shift(x * RIGHT + y * UP)
 
-        transform_attr_value = element.getAttribute("transform")
+        transform_attr_value = element.get("transform", "")
 
         # parse the various transforms in the attribute value
-        transform_names = ["matrix", "translate", "scale", "rotate", "skewX", "skewY"]
-
-        # Borrowed/Inspired from:
-        # https://github.com/cjlano/svg/blob/3ea3384457c9780fa7d67837c9c5fd4ebc42cb3b/svg/svg.py#L75
-
-        # match any SVG transformation with its parameter (until final parenthese)
-        # [^)]*    == anything but a closing parenthese
-        # '|'.join == OR-list of SVG transformations
-        transform_regex = "|".join([x + r"[^)]*\)" for x in transform_names])
-        transforms = re.findall(transform_regex, transform_attr_value)
-
-        number_regex = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+        transforms = TRANSFORM_RE.findall(transform_attr_value)
 
         for t in transforms:
             op_name, op_args = t.split("(")
             op_name = op_name.strip()
-            op_args = [float(x) for x in re.findall(number_regex, op_args)]
+            op_args = [float(x) for x in NUMBER_RE.findall(op_args)]
 
             if op_name == "matrix":
                 transform_args = np.array(op_args).reshape([3, 2])
                 x = transform_args[2][0]
                 y = -transform_args[2][1]
-                matrix = np.identity(self.dim)
-                matrix[:2, :2] = transform_args[:2, :]
-                matrix[1] *= -1
-                matrix[:, 1] *= -1
-
-                for mob in mobject.family_members_with_points():
-                    mob.points = np.dot(mob.points, matrix)
+                if transform_args[0][1] == 0 and transform_args[1][0] == 0:
+                    # No rotation or skew, so just scale each axis
+                    self.scale_points_about_origin(
+                        mobject, transform_args[0][0], transform_args[1][1]
+                    )
+                else:
+                    matrix = np.identity(self.dim)
+                    matrix[:2, :2] = transform_args[:2, :]
+                    matrix[1] *= -1
+                    matrix[:, 1] *= -1
+                    self.apply_matrix_to_points(mobject, matrix)
                 mobject.shift(x * RIGHT + y * UP)
 
             elif op_name == "scale":
                 scale_values = op_args
                 if len(scale_values) == 2:
                     scale_x, scale_y = scale_values
-                    mobject.scale(np.array([scale_x, scale_y, 1]), about_point=ORIGIN)
+                    self.scale_points_about_origin(mobject, scale_x, scale_y)
                 elif len(scale_values) == 1:
                     scale = scale_values[0]
-                    mobject.scale(np.array([scale, scale, 1]), about_point=ORIGIN)
+                    self.scale_points_about_origin(mobject, scale, scale)
 
             elif op_name == "translate":
                 if len(op_args) == 2:
                     x, y = op_args
                 else:
-                    x = op_args
+                    x = op_args[0]
                     y = 0
                 mobject.shift(x * RIGHT + y * DOWN)
 
@@ -457,23 +706,66 @@ class SVGMobject(VMobject):
                 # TODO: handle rotate, skewX and skewY
                 # for now adding a warning message
 
+    def scale_points_about_origin(self, mobject, scale_x, scale_y):
+        """Scales the x and y coordinates of all points in ``mobject``
+        in place, which avoids a full matrix multiplication.
+        """
+        for mob in mobject.family_members_with_points():
+            points = mob.get_points()
+            points[:, 0] *= scale_x
+            points[:, 1] *= scale_y
+        mobject.refresh_bounding_box(recurse_down=True)
+        if scale_x * scale_y < 0:
+            # Orientation was reversed
+            mobject.refresh_unit_normal()
+
+    def apply_matrix_to_points(self, mobject, matrix):
+        """Multiplies the points of every submobject of ``mobject`` by
+        ``matrix``, using a single multiplication over all of them.
+        """
+        mobs = mobject.family_members_with_points()
+        if not mobs:
+            return
+        all_points = np.vstack([mob.get_points() for mob in mobs])
+        all_points = np.dot(all_points, matrix)
+        start = 0
+        for mob in mobs:
+            points = mob.get_points()
+            end = start + len(points)
+            points[:] = all_points[start:end]
+            start = end
+        mobject.refresh_bounding_box(recurse_down=True)
+        if np.linalg.det(matrix) < 0:
+            # Orientation was reversed
+            mobject.refresh_unit_normal()
+
     def flatten(self, input_list):
         """A helper method to flatten the ``input_list`` into an 1D array."""
         output_list = []
-        for i in input_list:
-            if isinstance(i, list):
-                output_list.extend(self.flatten(i))
+        # Walk nested lists with an explicit stack rather than recursion
+        stack = list(reversed(input_list))
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(reversed(item))
             else:
-                output_list.append(i)
+                output_list.append(item)
         return output_list
 
     def get_all_childNodes_have_id(self, element):
         all_childNodes_have_id = []
-        if not isinstance(element, minidom.Element):
+        if isinstance(element, minidom.Element):
+            # Hand minidom nodes back to callers which passed them in
+            if element.hasAttribute("id"):
+                return [element]
+            children = element.childNodes
+        elif isinstance(element, Element):
+            if "id" in element.attrib:
+                return [element]
+            children = element
+        else:
             return
-        if element.hasAttribute("id"):
-            return [element]
-        for e in element.childNodes:
+        for e in children:
             all_childNodes_have_id.append(self.get_all_childNodes_have_id(e))
         return self.flatten([e for e in all_childNodes_have_id if e])
 
@@ -493,80 +785,160 @@ class VMobjectFromSVGPathstring(VMobject):
         # After a given svg_path has been converted into points, the result
         # will be saved to a file so that future calls for the same path
         # don't need to retrace the same computation.
-        hasher = hashlib.sha256(self.path_string.encode())
-        path_hash = hasher.hexdigest()[:16]
-        points_filepath = os.path.join(
-            get_mobject_data_dir(), f"{path_hash}_points.npy"
+        data_filepath = get_path_data_filepath(
+            self.path_string, self.get_path_config()
         )
-        tris_filepath = os.path.join(get_mobject_data_dir(), f"{path_hash}_tris.npy")
 
-        if os.path.exists(points_filepath) and os.path.exists(tris_filepath):
-            self.set_points(np.load(points_filepath))
-        else:
-            self.relative_point = np.array(ORIGIN)
-            for command, coord_string in self.get_commands_and_coord_strings():
-                new_points = self.string_to_points(command, coord_string)
+        self.relative_point = np.array(ORIGIN)
+        try:
+            points, triangulation, bounding_box = load_path_arrays(data_filepath)
+        except UNREADABLE_PATH_DATA_ERRORS:
+            commands, offsets, numbers = scan_path_string(
+                self.path_string, self.get_command_pattern()
+            )
+            # Points are traced into one buffer sized from the number
+            # count, see append_points
+            self.points_buffer = np.zeros((3 * len(numbers) + 1, self.dim))
+            self.data["points"] = self.points_buffer[:0]
+            for command, start, end in zip(commands, offsets, offsets[1:]):
+                new_points = self.numbers_to_points(command, numbers[start:end])
                 self.handle_command(command, new_points)
+            self.data["points"] = self.get_points().copy()
+            # Only needed while parsing, so don't keep it on every path
+            del self.points_buffer
+            # Leave relative_point ready for later calls to handle_command
+            self.relative_point = np.array(ORIGIN)
             if self.should_subdivide_sharp_curves:
                 # For a healthy triangulation later
                 self.subdivide_sharp_curves()
             if self.should_remove_null_curves:
                 # Get rid of any null curves
                 self.set_points(self.get_points_without_null_curves())
-            # SVG treats y-coordinate differently
-            self.stretch(-1, 1, about_point=ORIGIN)
+            # SVG treats y-coordinate differently.  Flipping in place
+            # skips the generic apply_points_function machinery.
+            self.get_points()[:, 1] *= -1
+            self.refresh_bounding_box()
+            self.refresh_unit_normal()
             # Save to a file for future use
-            np.save(points_filepath, self.get_points())
+            save_path_arrays(
+                data_filepath,
+                self.get_points(),
+                self.get_triangulation(),
+                self.get_bounding_box(),
+            )
+        else:
+            self.set_points(points)
+            self.triangulation = triangulation
+            self.needs_new_triangulation = False
+            self.data["bounding_box"] = bounding_box.copy()
+            self.needs_new_bounding_box = False
+
+    def append_points(self, new_points):
+        if not hasattr(self, "points_buffer"):
+            return super().append_points(new_points)
+        # While tracing the path string, write into the spare room of
+        # points_buffer, growing it geometrically when full, rather than
+        # copying every prior point for each command
+        new_points = np.array(new_points, ndmin=2)
+        points = self.get_points()
+        start = len(points)
+        end = start + len(new_points)
+        if end > len(self.points_buffer) or points.base is not self.points_buffer:
+            buffer = np.zeros((max(2 * end, len(self.points_buffer)), self.dim))
+            buffer[:start] = points
+            self.points_buffer = buffer
+        self.points_buffer[start:end] = new_points
+        self.data["points"] = self.points_buffer[:end]
+        self.refresh_bounding_box()
+        return self
+
+    def get_path_config(self):
+        return tuple(getattr(self, key) for key in PATH_CONFIG_KEYS)
+
+    def has_default_commands(self):
+        # Subclasses overriding get_command_to_function_map opt out of
+        # the module-level command tables
+        return (
+            type(self).get_command_to_function_map
+            is VMobjectFromSVGPathstring.get_command_to_function_map
+        )
+
+    def get_command_pattern(self):
+        if self.has_default_commands():
+            return PATH_COMMAND_RE
+        # The set of commands is fixed per class, so compile it only once
+        cls = type(self)
+        if "command_pattern" not in cls.__dict__:
+            all_commands = list(self.get_command_to_function_map().keys())
+            all_commands += [c.lower() for c in all_commands]
+            cls.command_pattern = re.compile("[{}]".format("".join(all_commands)))
+        return cls.command_pattern
 
     def get_commands_and_coord_strings(self):
-        all_commands = list(self.get_command_to_function_map().keys())
-        all_commands += [c.lower() for c in all_commands]
-        pattern = "[{}]".format("".join(all_commands))
+        pattern = self.get_command_pattern()
         return zip(
-            re.findall(pattern, self.path_string),
-            re.split(pattern, self.path_string)[1:],
+            pattern.findall(self.path_string),
+            pattern.split(self.path_string)[1:],
         )
 
     def handle_command(self, command, new_points):
-        if command.islower():
-            # Treat it as a relative command
-            new_points += self.relative_point
+        if command.upper() == "M" and len(new_points) > 1:
+            self.handle_command(command, new_points[:1])
+            # Treat following points as line coordinates
+            command = "l" if command.islower() else "L"
+            new_points = new_points[1:]
 
         func, n_points = self.command_to_function(command)
-        func(*new_points[:n_points])
-        leftover_points = new_points[n_points:]
-
-        # Recursively handle the rest of the points
-        if len(leftover_points) > 0:
-            if command.upper() == "M":
-                # Treat following points as relative line coordinates
-                command = "l"
+        bulk_func_name = None
+        if self.has_default_commands():
+            bulk_func_name = PATH_COMMAND_TO_BULK_METHOD.get(command.upper())
+        if bulk_func_name is not None:
             if command.islower():
-                leftover_points -= self.relative_point
-                self.relative_point = self.get_last_point()
-            self.handle_command(command, leftover_points)
+                # Each segment is relative to the end of the previous one
+                ends = new_points[n_points - 1::n_points]
+                offsets = np.cumsum(
+                    np.vstack([self.relative_point, ends[:-1]]), axis=0
+                )
+                new_points = new_points + offsets.repeat(n_points, axis=0)
+            bulk_func = getattr(self, bulk_func_name)
+            bulk_func(*(new_points[i::n_points] for i in range(n_points)))
         else:
-            # Command is over, reset for future relative commands
-            self.relative_point = self.get_last_point()
+            while True:
+                points = new_points[:n_points]
+                if command.islower():
+                    # Treat it as a relative command
+                    points = points + self.relative_point
+                func(*points)
+                new_points = new_points[n_points:]
+                if n_points == 0 or len(new_points) == 0:
+                    break
+                # Following points are relative to the end of this segment
+                self.relative_point = self.get_last_point()
+        # Command is over, reset for future relative commands
+        self.relative_point = self.get_last_point()
 
     def string_to_points(self, command, coord_string):
-        numbers = string_to_numbers(coord_string)
+        return self.numbers_to_points(command, string_to_numbers(coord_string))
+
+    def numbers_to_points(self, command, numbers):
         if command.upper() in ["H", "V"]:
             i = {"H": 0, "V": 1}[command.upper()]
-            xy = np.zeros((len(numbers), 2))
-            xy[:, i] = numbers
+            result = np.zeros((len(numbers), self.dim))
+            result[:, i] = numbers
             if command.isupper():
-                xy[:, 1 - i] = self.relative_point[1 - i]
+                result[:, 1 - i] = self.relative_point[1 - i]
         elif command.upper() == "A":
             raise Exception("Not implemented")
         else:
-            xy = np.array(numbers).reshape((len(numbers) // 2, 2))
-        result = np.zeros((xy.shape[0], self.dim))
-        result[:, :2] = xy
+            result = np.zeros((len(numbers) // 2, self.dim))
+            result[:, :2] = np.reshape(numbers, (-1, 2))
         return result
 
     def command_to_function(self, command):
-        return self.get_command_to_function_map()[command.upper()]
+        if not self.has_default_commands():
+            return self.get_command_to_function_map()[command.upper()]
+        func_name, n_points = PATH_COMMAND_TO_METHOD[command.upper()]
+        return getattr(self, func_name), n_points
 
     def get_command_to_function_map(self):
         """
@@ -574,16 +946,8 @@ class VMobjectFromSVGPathstring(VMobject):
         the number of arguments it takes in
         """
         return {
-            "M": (self.start_new_path, 1),
-            "L": (self.add_line_to, 1),
-            "H": (self.add_line_to, 1),
-            "V": (self.add_line_to, 1),
-            "C": (self.add_cubic_bezier_curve_to, 3),
-            "S": (self.add_smooth_cubic_curve_to, 2),
-            "Q": (self.add_quadratic_bezier_curve_to, 2),
-            "T": (self.add_smooth_curve_to, 1),
-            "A": (self.add_quadratic_bezier_curve_to, 2),  # TODO
-            "Z": (self.close_path, 0),
+            command: (getattr(self, func_name), n_points)
+            for command, (func_name, n_points) in PATH_COMMAND_TO_METHOD.items()
         }
 
     def get_original_path_string(self):
@@ -1,9 +1,12 @@
-import copy
+import bisect
 import hashlib
+import itertools as it
 import os
 import re
+import tempfile
 import typing
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import manimpango
@@ -19,6 +22,22 @@ from manimpango import TextSetting
 
 TEXT_MOB_SCALE_FACTOR = 0.001048
 
+EMPTY_PATH_RE = re.compile(r'<path [^>]*?d=""/>')
+# Words like "[2:5]" or "[-3:]" select characters by slice
+SLICE_WORD_RE = re.compile(r"\[([0-9\-]{0,}):([0-9\-]{0,})\]")
+
+# Characters which don't get a glyph of their own in the svg
+SPACE_CHARS = frozenset(" \t\n")
+
+text_svg_to_submobs_map = {}
+
+
+@lru_cache(maxsize=1)
+def get_space_char_template():
+    # Whitespace has no glyph in the svg, so Text fills those slots
+    # with copies of this invisible dot
+    return Dot(radius=0, fill_opacity=0, stroke_opacity=0)
+
 
 class Paragraph(VGroup):
     r"""Display a paragraph of text.
@@ -53,35 +72,29 @@ class Paragraph(VGroup):
         lines_str_list = lines_str.split("\n")
         self.chars = self.gen_chars(lines_str_list)
 
-        chars_lines_text_list = VGroup()
-        char_index_counter = 0
-        for line_index in range(lines_str_list.__len__()):
-            chars_lines_text_list.add(
-                self.lines_text[
-                    char_index_counter : char_index_counter
-                    + lines_str_list[line_index].__len__()
-                    + 1
-                ]
-            )
-            char_index_counter += lines_str_list[line_index].__len__() + 1
-        self.lines = []
-        self.lines.append([])
-        for line_no in range(chars_lines_text_list.__len__()):
-            self.lines[0].append(chars_lines_text_list[line_no])
-        self.lines_initial_positions = []
-        for line_no in range(self.lines[0].__len__()):
-            self.lines_initial_positions.append(self.lines[0][line_no].get_center())
-        self.lines.append([])
-        self.lines[1].extend(
-            [self.alignment for _ in range(chars_lines_text_list.__len__())]
-        )
-        VGroup.__init__(
-            self, *[self.lines[0][i] for i in range(self.lines[0].__len__())], **config
-        )
+        chars_lines_text_list = VGroup(*(
+            self.lines_text[line_slice]
+            for line_slice in self.get_line_slices(lines_str_list)
+        ))
+        self.lines = [
+            list(chars_lines_text_list),
+            [self.alignment] * len(chars_lines_text_list),
+        ]
+        self.lines_initial_positions = [
+            line.get_center() for line in self.lines[0]
+        ]
+        self.set_submobjects(self.lines[0])
         self.move_to(np.array([0, 0, 0]))
         if self.alignment:
             self.set_all_lines_alignments(self.alignment)
 
+    def get_line_slices(self, lines_str_list):
+        """Slices of ``self.lines_text`` for each line, each one also
+        covering the newline which follows it.
+        """
+        offsets = [0, *it.accumulate(len(line) + 1 for line in lines_str_list)]
+        return [slice(start, end) for start, end in zip(offsets, offsets[1:])]
+
     def gen_chars(self, lines_str_list):
         """Function to convert plain string to 2d-VGroup of chars. 2d-VGroup mean "VGroup of VGroup".
         Parameters
@@ -93,20 +106,11 @@ class Paragraph(VGroup):
         :class:`~.VGroup`
             The generated 2d-VGroup of chars.
         """
-        char_index_counter = 0
-        chars = VGroup()
-        for line_no in range(lines_str_list.__len__()):
-            chars.add(VGroup())
-            chrs = [*self.lines_text.submobjects]
-            chars[line_no].add(
-                *chrs[
-                    char_index_counter : char_index_counter
-                    + lines_str_list[line_no].__len__()
-                    + 1
-                ]
-            )
-            char_index_counter += lines_str_list[line_no].__len__() + 1
-        return chars
+        chrs = self.lines_text.submobjects
+        return VGroup(*(
+            VGroup(*chrs[line_slice])
+            for line_slice in self.get_line_slices(lines_str_list)
+        ))
 
     def set_all_lines_alignments(self, alignment):
         """Function to set all line's alignment to a specific value.
@@ -115,8 +119,23 @@ class Paragraph(VGroup):
         alignment : :class:`str`
             Defines the alignment of paragraph. Possible values are "left", "right", "center".
         """
-        for line_no in range(0, self.lines[0].__len__()):
-            self.change_alignment_for_a_line(alignment, line_no)
+        # Every line aligns to the same paragraph edges, so find them once
+        # rather than recomputing the bounding box after each move
+        center_x = self.get_center()[0]
+        left_x = self.get_left()[0]
+        right_x = self.get_right()[0]
+        for line_no in range(len(self.lines[0])):
+            self.lines[1][line_no] = alignment
+            line = self[line_no]
+            if alignment == "center":
+                x = center_x
+            elif alignment == "right":
+                x = right_x - line.get_width() / 2
+            elif alignment == "left":
+                x = left_x + line.get_width() / 2
+            else:
+                continue
+            line.move_to(np.array([x, line.get_center()[1], 0]))
         return self
 
     def set_line_alignment(self, alignment, line_no):
@@ -133,8 +152,8 @@ class Paragraph(VGroup):
 
     def set_all_lines_to_initial_positions(self):
         """Set all lines to their initial positions."""
-        self.lines[1] = [None for _ in range(self.lines[0].__len__())]
-        for line_no in range(0, self.lines[0].__len__()):
+        self.lines[1] = [None] * len(self.lines[0])
+        for line_no in range(len(self.lines[0])):
             self[line_no].move_to(
                 self.get_center() + self.lines_initial_positions[line_no]
             )
@@ -214,13 +233,8 @@ class Text(SVGMobject):
         self.full2short(config)
         digest_config(self, config)
         self.lsh = self.size if self.lsh == -1 else self.lsh
-        text_without_tabs = text
-        if text.find("\t") != -1:
-            text_without_tabs = text.replace("\t", " " * self.tab_width)
-        self.text = text_without_tabs
+        self.text = text.replace("\t", " " * self.tab_width)
         file_name = self.text2svg()
-        PangoUtils.remove_last_M(file_name)
-        self.remove_empty_path(file_name)
         SVGMobject.__init__(self, file_name, **config)
         self.text = text
         if self.disable_ligatures:
@@ -236,24 +250,45 @@ class Text(SVGMobject):
         if self.height is None:
             self.scale(TEXT_MOB_SCALE_FACTOR * self.font_size)
 
+    def init_points(self):
+        # Parsing the svg is most of the cost of a Text, so keep what each
+        # file parses to, and have later Text with the same file copy it
+        key = (self.file_path, self.unpack_groups, str(self.path_string_config))
+        if key not in text_svg_to_submobs_map:
+            super().init_points()
+            text_svg_to_submobs_map[key] = [sm.copy() for sm in self.submobjects]
+        else:
+            self.add(*(sm.copy() for sm in text_svg_to_submobs_map[key]))
+
     def remove_empty_path(self, file_name):
         with open(file_name, "r") as fpr:
             content = fpr.read()
-        content = re.sub(r'<path .*?d=""/>', "", content)
+        content, n_removed = EMPTY_PATH_RE.subn("", content)
+        if n_removed == 0:
+            return
         with open(file_name, "w") as fpw:
             fpw.write(content)
 
     def apply_space_chars(self):
-        submobs = self.submobjects.copy()
-        for char_index in range(len(self.text)):
-            if self.text[char_index] in [" ", "\t", "\n"]:
-                space = Dot(radius=0, fill_opacity=0, stroke_opacity=0)
-                space.move_to(submobs[max(char_index - 1, 0)].get_center())
-                submobs.insert(char_index, space)
+        # Build the list in one pass, rather than inserting each space
+        glyphs = iter(self.submobjects)
+        submobs = []
+        for char in self.text:
+            if char in SPACE_CHARS:
+                # Sit on the previous character, or the first for leading spaces
+                neighbor = submobs[-1] if submobs else self.submobjects[0]
+                space = get_space_char_template().copy()
+                space.move_to(neighbor.get_center())
+                submobs.append(space)
+            else:
+                glyph = next(glyphs, None)
+                if glyph is not None:
+                    submobs.append(glyph)
+        submobs.extend(glyphs)
         self.set_submobjects(submobs)
 
     def find_indexes(self, word):
-        m = re.match(r"\[([0-9\-]{0,}):([0-9\-]{0,})\]", word)
+        m = SLICE_WORD_RE.match(word)
         if m:
             start = int(m.group(1)) if m.group(1) != "" else 0
             end = int(m.group(2)) if m.group(2) != "" else len(self.text)
@@ -262,10 +297,12 @@ class Text(SVGMobject):
             return [(start, end)]
 
         indexes = []
-        index = self.text.find(word)
+        text = self.text
+        word_len = len(word)
+        index = text.find(word)
         while index != -1:
-            indexes.append((index, index + len(word)))
-            index = self.text.find(word, index + len(word))
+            indexes.append((index, index + word_len))
+            index = text.find(word, index + word_len)
         return indexes
 
     def get_parts_by_text(self, word):
@@ -310,18 +347,22 @@ class Text(SVGMobject):
         settings += str(self.t2f) + str(self.t2s) + str(self.t2w)
         settings += str(self.lsh) + str(self.size)
         id_str = self.text + settings
-        hasher = hashlib.sha256()
-        hasher.update(id_str.encode())
-        return hasher.hexdigest()[:16]
+        hasher = hashlib.blake2b(id_str.encode(), digest_size=8)
+        return hasher.hexdigest()
 
     def text2settings(self):
         settings = []
         t2x = [self.t2f, self.t2s, self.t2w]
+        # The same word is often given a font, slant and weight together,
+        # so only search for each one once
+        word_to_indexes = {}
         for i in range(len(t2x)):
             fsw = [self.font, self.slant, self.weight]
             if t2x[i]:
                 for word, x in list(t2x[i].items()):
-                    for start, end in self.find_indexes(word):
+                    if word not in word_to_indexes:
+                        word_to_indexes[word] = self.find_indexes(word)
+                    for start, end in word_to_indexes[word]:
                         fsw[i] = x
                         settings.append(TextSetting(start, end, *fsw))
 
@@ -338,21 +379,27 @@ class Text(SVGMobject):
             temp_settings.append(TextSetting(start, len(self.text), *fsw))
         settings = sorted(temp_settings, key=lambda setting: setting.start)
 
-        if re.search(r"\n", self.text):
-            line_num = 0
-            for start, end in self.find_indexes("\n"):
-                for setting in settings:
-                    if setting.line_num == -1:
-                        setting.line_num = line_num
-                    if start < setting.end:
-                        line_num += 1
-                        new_setting = copy.copy(setting)
-                        setting.end = end
-                        new_setting.start = end
-                        new_setting.line_num = line_num
-                        settings.append(new_setting)
-                        settings.sort(key=lambda setting: setting.start)
-                        break
+        if "\n" in self.text:
+            # Split each setting after every newline inside it, so that
+            # each piece lies on a single line
+            newlines = [i for i, char in enumerate(self.text) if char == "\n"]
+            split_settings = []
+            for setting in settings:
+                first_line = bisect.bisect_left(newlines, setting.start)
+                last_line = bisect.bisect_left(newlines, setting.end)
+                start = setting.start
+                for line_num in range(first_line, last_line):
+                    piece = TextSetting(
+                        start, newlines[line_num] + 1,
+                        setting.font, setting.slant, setting.weight,
+                        line_num,
+                    )
+                    split_settings.append(piece)
+                    start = piece.end
+                setting.start = start
+                setting.line_num = last_line
+                split_settings.append(setting)
+            settings = sorted(split_settings, key=lambda setting: setting.start)
 
         for setting in settings:
             if setting.line_num == -1:
@@ -377,18 +424,34 @@ class Text(SVGMobject):
         width = 600
         height = 400
         disable_liga = self.disable_ligatures
-        return manimpango.text2svg(
-            settings,
-            size,
-            lsh,
-            disable_liga,
-            file_name,
-            START_X,
-            START_Y,
-            width,
-            height,
-            self.text,
-        )
+        # Render to a temporary file and only move it into place once
+        # cleaned up, so an interruption never leaves a half done file
+        # behind to be reused
+        fd, temp_name = tempfile.mkstemp(suffix=".svg", dir=dir_name)
+        os.close(fd)
+        try:
+            temp_name = manimpango.text2svg(
+                settings,
+                size,
+                lsh,
+                disable_liga,
+                temp_name,
+                START_X,
+                START_Y,
+                width,
+                height,
+                self.text,
+            )
+            # Clean up the file once here, so that reusing it doesn't
+            # rewrite it every time
+            PangoUtils.remove_last_M(temp_name)
+            self.remove_empty_path(temp_name)
+            os.replace(temp_name, file_name)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+        return file_name
 
 
 @contextmanager
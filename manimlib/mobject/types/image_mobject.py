@@ -25,23 +25,45 @@ class ImageMobject(Mobject):
     def __init__(self, filename, **kwargs):
         path = get_full_raster_image_path(filename)
         self.image = Image.open(path)
-        self.pixel_array = np.array(self.image)
+        # Read now so the file isn't held open, even though the pixel
+        # array itself is only built when needed
+        self.image.load()
+        self._pixel_array = None
         self.texture_paths = {"Texture": path}
         super().__init__(**kwargs)
-        self.change_to_rgba_array()
+
+    @property
+    def pixel_array(self):
+        # Rendering reads the texture file directly, so the RGBA array
+        # is only made the first time something asks for it
+        if self._pixel_array is None:
+            image = self.image
+            if image.mode != "RGBA":
+                # PIL fills in the missing channels in one pass, and also
+                # resolves palettes and bilevel images to real colors
+                image = image.convert("RGBA")
+            self._pixel_array = np.array(image)
+        return self._pixel_array
+
+    @pixel_array.setter
+    def pixel_array(self, pixel_array):
+        self._pixel_array = pixel_array
 
     def change_to_rgba_array(self):
         """Converts an RGB array into RGBA with the alpha value opacity maxed."""
         pa = self.pixel_array
         if len(pa.shape) == 2:
             pa = pa.reshape(list(pa.shape) + [1])
-        if pa.shape[2] == 1:
-            pa = pa.repeat(3, axis=2)
-        if pa.shape[2] == 3:
-            alphas = 255 * np.ones(
-                list(pa.shape[:2]) + [1], dtype=self.pixel_array_dtype
+        if pa.shape[2] in (1, 3):
+            # Fill one RGBA buffer, rather than copying once to repeat
+            # the grey channel and again to append alphas
+            rgba = np.empty(
+                (*pa.shape[:2], 4),
+                dtype=np.result_type(pa.dtype, self.pixel_array_dtype),
             )
-            pa = np.append(pa, alphas, axis=2)
+            rgba[:, :, :3] = pa
+            rgba[:, :, 3] = 255
+            pa = rgba
         self.pixel_array = pa
 
     def init_data(self):
@@ -57,27 +79,34 @@ class ImageMobject(Mobject):
         self.set_height(self.height)
 
     def set_opacity(self, opacity, recurse=True):
+        opacities = np.array(listify(opacity), dtype=np.float32).reshape(-1, 1)
         for mob in self.get_family(recurse):
-            mob.data["opacity"] = np.array([[o] for o in listify(opacity)])
+            # Each mobject gets its own copy, as data is updated in place
+            mob.data["opacity"] = opacities.copy()
         return self
 
     def point_to_rgb(self, point):
+        return self.points_to_rgb([point])[0]
+
+    def points_to_rgb(self, points):
+        """
+        Samples the image's colors at many points at once, with a single
+        lookup into the pixel array.
+        """
+        points = np.array(points, ndmin=2)
         x0, y0 = self.get_corner(UL)[:2]
         x1, y1 = self.get_corner(DR)[:2]
-        x_alpha = inverse_interpolate(x0, x1, point[0])
-        y_alpha = inverse_interpolate(y0, y1, point[1])
-        if not (0 <= x_alpha <= 1) and (0 <= y_alpha <= 1):
+        x_alphas = inverse_interpolate(x0, x1, points[:, 0])
+        y_alphas = inverse_interpolate(y0, y1, points[:, 1])
+        alphas = np.array([x_alphas, y_alphas])
+        if ((alphas < 0) | (alphas > 1)).any():
             # TODO, raise smarter exception
             raise Exception("Cannot sample color from outside an image")
 
-        pw, ph = self.image.size
-        rgb = self.image.getpixel(
-            (
-                int((pw - 1) * x_alpha),
-                int((ph - 1) * y_alpha),
-            )
-        )
-        return np.array(rgb) / 255
+        ph, pw = self.pixel_array.shape[:2]
+        rows = ((ph - 1) * y_alphas).astype(int)
+        cols = ((pw - 1) * x_alphas).astype(int)
+        return self.pixel_array[rows, cols, :3] / 255
 
     def get_shader_data(self):
         shader_data = super().get_shader_data()
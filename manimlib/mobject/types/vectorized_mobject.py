@@ -352,6 +352,56 @@ class VMobject(Mobject):
         self.append_points(points)
         return self
 
+    def add_cubic_bezier_curves_to(self, handles1, handles2, anchors):
+        """
+        Add a sequence of cubic bezier curves to the path, each
+        starting where the previous one ends.
+        """
+        self.throw_error_if_no_points()
+        anchors = np.array(anchors, ndmin=2)
+        starts = np.vstack([self.get_points()[-1:], anchors[:-1]])
+        quadratic_approx = get_quadratic_approximation_of_cubic(
+            starts, handles1, handles2, anchors
+        )
+        if self.has_new_path_started():
+            self.append_points(quadratic_approx[1:])
+        else:
+            self.append_points(quadratic_approx)
+        return self
+
+    def add_quadratic_bezier_curves_to(self, handles, anchors):
+        self.throw_error_if_no_points()
+        anchors = np.array(anchors, ndmin=2)
+        new_points = np.zeros((len(anchors), 3, self.dim))
+        new_points[0, 0] = self.get_last_point()
+        new_points[1:, 0] = anchors[:-1]
+        new_points[:, 1] = handles
+        new_points[:, 2] = anchors
+        new_points = new_points.reshape((-1, self.dim))
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
+        return self
+
+    def add_lines_to(self, points):
+        points = np.array(points, ndmin=2)
+        ends = points[:, np.newaxis]
+        starts = np.vstack([self.get_points()[-1:], points[:-1]])[:, np.newaxis]
+        alphas = np.linspace(0, 1, self.n_points_per_curve)[:, np.newaxis]
+        if self.long_lines:
+            halfways = interpolate(starts, ends, 0.5)
+            new_points = np.hstack([
+                interpolate(starts, halfways, alphas),
+                interpolate(halfways, ends, alphas),
+            ])
+        else:
+            new_points = interpolate(starts, ends, alphas)
+        new_points = new_points.reshape((-1, self.dim))
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
+        return self
+
     def add_smooth_curve_to(self, point):
         if self.has_new_path_started():
             self.add_line_to(point)